@@ -24,7 +24,8 @@ rst_prolog = f""".. |pkgname| replace:: sphinx-pyproject
 .. |browse_github| replace:: `Browse the GitHub Repository <{github_url}>`__
 """
 
-slug = re.sub(r'\W+', '-', project.lower())
+_SLUG_RE = re.compile(r'\W+')
+slug = _SLUG_RE.sub('-', project.lower())
 release = version = config.version
 
 sphinx_builder = os.environ.get("SPHINX_BUILDER", "html").lower()
@@ -27,16 +27,23 @@ Move some of your Sphinx configuration into ``pyproject.toml``.
 #
 
 # stdlib
+import copy
+import functools
+import os
 import re
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional
+import sys
+from typing import Any, ClassVar, Dict, Iterator, List, Mapping, MutableMapping, Optional
 
 # 3rd party
-import dom_toml
-from dom_toml.decoder import TomlPureDecoder
 from dom_toml.parser import TOML_TYPES, AbstractConfigParser, BadConfigError
-from domdf_python_tools.paths import PathPlus
 from domdf_python_tools.typing import PathLike
-from domdf_python_tools.words import word_join
+
+if sys.version_info >= (3, 11):
+	# stdlib
+	import tomllib
+else:
+	# 3rd party
+	import tomli as tomllib
 
 __author__: str = "Dominic Davis-Foster"
 __copyright__: str = "2021 Dominic Davis-Foster"
@@ -46,6 +53,56 @@ __email__: str = "dominic@davis-foster.co.uk"
 
 __all__ = ["SphinxConfig", "ProjectParser", "PoetryProjectParser"]
 
+_POETRY_AUTHOR_RE = re.compile(r"(?P<name>.*)<(?P<email>.*)>")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_toml(path: str, mtime_ns: int) -> Dict[str, Any]:
+	"""
+	Load and parse the TOML file at ``path``, caching the result.
+
+	The cache is keyed on ``(path, mtime_ns)``,
+	so editing the file invalidates its cached entry.
+
+	:param path: The (absolute) path to the TOML file.
+	:param mtime_ns: The modification time of the file, in nanoseconds.
+	"""
+
+	with open(path, "rb") as fp:
+		return tomllib.load(fp)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_project(path: str, mtime_ns: int, style: str) -> Dict[str, Any]:
+	"""
+	Parse the project metadata from the TOML file at ``path``, caching the result.
+
+	The parsed metadata is a pure function of the file contents,
+	so the cache is keyed on ``(path, mtime_ns)`` like :func:`~._load_toml`.
+
+	:param path: The (absolute) path to the TOML file.
+	:param mtime_ns: The modification time of the file, in nanoseconds.
+	:param style: The name of a parser style from :data:`~.project_parser_styles`.
+	"""
+
+	config = _load_toml(path, mtime_ns)
+	parser_cls = project_parser_styles[style]
+	namespace = parser_cls.get_namespace(path, config)
+	return parser_cls().parse(dict(namespace))
+
+
+def _join_names(names: List[str]) -> str:
+	"""
+	Join a non-empty list of names together, e.g. as ``'Alice, Bob and Carol'``.
+
+	:param names:
+	"""
+
+	if len(names) == 1:
+		return names[0]
+
+	return f"{', '.join(names[:-1])} and {names[-1]}"
+
 
 class SphinxConfig(Mapping[str, Any]):
 	"""
@@ -137,16 +194,14 @@ class SphinxConfig(Mapping[str, Any]):
 			config_overrides: Optional[MutableMapping] = None,
 			):
 
-		pyproject_file = PathPlus(pyproject_file).abspath()
-		config = dom_toml.load(pyproject_file, decoder=TomlPureDecoder)
-
-		parser_cls = project_parser_styles.get(style)
-		if parser_cls is None:
+		if style not in project_parser_styles:
 			styles = ", ".join(project_parser_styles)
 			raise ValueError(f"'style' argument must be one of: {styles}")
 
-		namespace = parser_cls.get_namespace(pyproject_file, config)
-		pep621_config = parser_cls().parse(namespace)
+		path = os.path.abspath(os.fspath(pyproject_file))
+		mtime_ns = os.stat(path).st_mtime_ns
+		config = _load_toml(path, mtime_ns)
+		pep621_config = dict(_parse_project(path, mtime_ns, style))
 
 		for key, value in (config_overrides or {}).items():
 			pep621_config[key] = value
@@ -160,8 +215,8 @@ class SphinxConfig(Mapping[str, Any]):
 
 		if "author" not in pep621_config:
 			raise BadConfigError(
-					f"Either 'authors/maintainers' was not declared in the 'project' table "
-					f"or it was marked as 'dynamic', which is unsupported by 'sphinx-pyproject'."
+					"Either 'authors/maintainers' was not declared in the 'project' table "
+					"or it was marked as 'dynamic', which is unsupported by 'sphinx-pyproject'."
 					)
 
 		self.name = pep621_config["name"]
@@ -169,7 +224,9 @@ class SphinxConfig(Mapping[str, Any]):
 		self.description = pep621_config["description"]
 		self.author = pep621_config["author"]
 
-		self._freeform = config.get("tool", {}).get("sphinx-pyproject", {})
+		# Deep copy so mutation of this instance's values (e.g. appending to a list
+		# placed in globalns) cannot poison the document cached by _load_toml.
+		self._freeform = copy.deepcopy(config.get("tool", {}).get("sphinx-pyproject", {}))
 
 		if globalns is not None:
 			globalns.update(pep621_config)
@@ -196,7 +253,7 @@ class SphinxConfig(Mapping[str, Any]):
 		Returns an iterator over the keys in the ``tool.sphinx-pyproject`` table.
 		"""
 
-		yield from self._freeform
+		return iter(self._freeform)
 
 
 class ProjectParser(AbstractConfigParser):
@@ -206,8 +263,17 @@ class ProjectParser(AbstractConfigParser):
 	.. autosummary-widths:: 7/16
 	"""
 
+	__slots__ = ()
+
+	keys: ClassVar[List[str]] = ["name", "version", "description", "author"]
+	"""
+	The keys to parse from the TOML file.
+
+	.. versionchanged:: 0.4.0  Now a class-level constant rather than a property returning a fresh list.
+	"""
+
 	@staticmethod
-	def get_namespace(filename: PathPlus, config: Dict[str, TOML_TYPES]) -> Dict[str, TOML_TYPES]:
+	def get_namespace(filename: PathLike, config: Dict[str, TOML_TYPES]) -> Dict[str, TOML_TYPES]:
 		"""
 		Returns the ``[project]`` table in a ``project.toml`` file.
 
@@ -215,12 +281,17 @@ class ProjectParser(AbstractConfigParser):
 		:param config: The data from the TOML file.
 
 		.. versionadded:: 0.2.0
+		.. versionchanged:: 0.4.0  ``filename`` may now be any path-like object.
 		"""
 
-		if "project" not in config:
-			raise BadConfigError(f"No 'project' table found in {filename.as_posix()}")
+		result = config.get("project")
+		if result is None:
+			# 3rd party
+			from domdf_python_tools.paths import PathPlus
 
-		return config["project"]
+			raise BadConfigError(f"No 'project' table found in {PathPlus(filename).as_posix()}")
+
+		return result
 
 	def parse_name(self, config: Dict[str, TOML_TYPES]) -> str:
 		"""
@@ -230,8 +301,12 @@ class ProjectParser(AbstractConfigParser):
 		"""
 
 		name = config["name"]
-		self.assert_type(name, str, ["project", "name"])
-		return str(name).replace('_', '-')
+		self.assert_type(name, str, ("project", "name"))
+
+		if '_' not in name:
+			return name
+
+		return name.replace('_', '-')
 
 	def parse_version(self, config: Dict[str, TOML_TYPES]) -> str:
 		"""
@@ -241,7 +316,7 @@ class ProjectParser(AbstractConfigParser):
 		"""
 
 		version = config["version"]
-		self.assert_type(version, (str, int), ["project", "version"])
+		self.assert_type(version, (str, int), ("project", "version"))
 		return str(version)
 
 	def parse_description(self, config: Dict[str, TOML_TYPES]) -> str:
@@ -252,7 +327,7 @@ class ProjectParser(AbstractConfigParser):
 		"""
 
 		description = config["description"]
-		self.assert_type(description, str, ["project", "description"])
+		self.assert_type(description, str, ("project", "description"))
 		return description
 
 	@staticmethod
@@ -263,35 +338,21 @@ class ProjectParser(AbstractConfigParser):
 		:param config: The unparsed TOML config for the ``[project]`` table.
 		"""
 
-		all_authors: List[Optional[str]] = []
+		all_authors: List[str] = []
 
 		for idx, author in enumerate(config["author"]):
-			name = author.get("name", None)
+			name = author.get("name")
 
-			if name is not None and ',' in name:
-				raise BadConfigError(f"The 'project.authors[{idx}].name' key cannot contain commas.")
+			if name:
+				if ',' in name:
+					raise BadConfigError(f"The 'project.authors[{idx}].name' key cannot contain commas.")
 
-			all_authors.append(name)
-
-		all_authors = list(filter(bool, all_authors))
+				all_authors.append(name)
 
 		if not all_authors:
-			raise BadConfigError(f"The 'project.authors' key cannot be empty.")
-
-		return word_join(all_authors)  # type: ignore
-
-	@property
-	def keys(self) -> List[str]:
-		"""
-		The keys to parse from the TOML file.
-		"""
+			raise BadConfigError("The 'project.authors' key cannot be empty.")
 
-		return [
-				"name",
-				"version",
-				"description",
-				"author",
-				]
+		return _join_names(all_authors)
 
 	def parse(
 			self,
@@ -310,7 +371,23 @@ class ProjectParser(AbstractConfigParser):
 		elif "maintainers" in config:
 			config["author"] = config.pop("maintainers")
 
-		return super().parse(config)
+		# The keys are fixed, so dispatch to the parse_* methods directly
+		# rather than through AbstractConfigParser.parse's getattr machinery.
+		parsed_config = {}
+
+		if "name" in config:
+			parsed_config["name"] = self.parse_name(config)
+
+		if "version" in config:
+			parsed_config["version"] = self.parse_version(config)
+
+		if "description" in config:
+			parsed_config["description"] = self.parse_description(config)
+
+		if "author" in config:
+			parsed_config["author"] = self.parse_author(config)
+
+		return parsed_config
 
 
 class PoetryProjectParser(ProjectParser):
@@ -320,18 +397,25 @@ class PoetryProjectParser(ProjectParser):
 	.. versionadded:: 0.2.0
 	"""
 
+	__slots__ = ()
+
 	@staticmethod
-	def get_namespace(filename: PathPlus, config: Dict[str, TOML_TYPES]) -> Dict[str, TOML_TYPES]:
+	def get_namespace(filename: PathLike, config: Dict[str, TOML_TYPES]) -> Dict[str, TOML_TYPES]:
 		"""
 		Returns the ``[tool.poetry]`` table in a ``project.toml`` file.
 
 		:param filename: The filename the TOML data was read from. Used in error messages.
 		:param config: The data from the TOML file.
+
+		.. versionchanged:: 0.4.0  ``filename`` may now be any path-like object.
 		"""
 
 		result = config.get("tool", {}).get("poetry")
 		if result is None:
-			raise BadConfigError(f"No 'tool.poetry' table found in {filename.as_posix()}")
+			# 3rd party
+			from domdf_python_tools.paths import PathPlus
+
+			raise BadConfigError(f"No 'tool.poetry' table found in {PathPlus(filename).as_posix()}")
 
 		return result
 
@@ -343,16 +427,25 @@ class PoetryProjectParser(ProjectParser):
 		:param config: The unparsed TOML config for the ``[tool.poetry]`` table.
 		"""
 
-		pep621_style_authors: List[Dict[str, str]] = []
+		all_authors: List[str] = []
 
-		for author in config["author"]:
-			match = re.match(r"(?P<name>.*)<(?P<email>.*)>", author)
-			if match:
-				name = match.group("name").strip()
-				email = match.group("email").strip()
-				pep621_style_authors.append({"name": name, "email": email})
+		for idx, author in enumerate(config["author"]):
+			match = _POETRY_AUTHOR_RE.match(author)
+			if match is None:
+				continue
+
+			name = match.group("name").strip()
+
+			if name:
+				if ',' in name:
+					raise BadConfigError(f"The 'project.authors[{idx}].name' key cannot contain commas.")
+
+				all_authors.append(name)
+
+		if not all_authors:
+			raise BadConfigError("The 'project.authors' key cannot be empty.")
 
-		return ProjectParser.parse_author({"author": pep621_style_authors})
+		return _join_names(all_authors)
 
 
 project_parser_styles = {
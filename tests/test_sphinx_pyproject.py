@@ -1,4 +1,5 @@
 # stdlib
+import os
 import textwrap
 from typing import Any, Dict
 
@@ -220,3 +221,47 @@ def test_config_overrides(tmp_pathplus: PathPlus):
 	assert config.author == "Dominic Davis-Foster"
 	assert config.version == "3.2.1"
 	assert config.description == "Description"
+
+
+def test_cache_invalidated_on_edit(tmp_pathplus: PathPlus):
+	pyproject_file = tmp_pathplus / "pyproject.toml"
+	pyproject_file.write_text(MINIMUM)
+
+	assert SphinxConfig(pyproject_file).version == "1.2.3"
+
+	pyproject_file.write_text(MINIMUM.replace("1.2.3", "4.5.6"))
+	# Some filesystems have coarse timestamps; make sure the mtime actually changes.
+	mtime_ns = os.stat(pyproject_file).st_mtime_ns + 1
+	os.utime(pyproject_file, ns=(mtime_ns, mtime_ns))
+
+	assert SphinxConfig(pyproject_file).version == "4.5.6"
+
+
+def test_cache_hit_for_unchanged_file(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "pyproject.toml").write_text(MULTIPLE_KEYS)
+
+	config_one = SphinxConfig(tmp_pathplus / "pyproject.toml")
+	config_two = SphinxConfig(tmp_pathplus / "pyproject.toml")
+
+	assert config_one.name == config_two.name
+	assert dict(config_one) == dict(config_two)
+
+
+def test_cache_isolates_config_overrides(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "pyproject.toml").write_text(MINIMUM)
+
+	overridden = SphinxConfig(tmp_pathplus / "pyproject.toml", config_overrides={"version": "3.2.1"})
+	assert overridden.version == "3.2.1"
+
+	# The override must not leak into configs constructed afterwards.
+	assert SphinxConfig(tmp_pathplus / "pyproject.toml").version == "1.2.3"
+
+
+def test_cache_isolates_freeform_values(tmp_pathplus: PathPlus):
+	(tmp_pathplus / "pyproject.toml").write_text(MULTIPLE_KEYS)
+
+	config = SphinxConfig(tmp_pathplus / "pyproject.toml")
+	config["extensions"].append("sphinx.ext.autodoc")
+
+	# Mutating one instance's values must not affect later constructions.
+	assert SphinxConfig(tmp_pathplus / "pyproject.toml")["extensions"] == ["sphinx-toolbox"]